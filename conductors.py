@@ -1,9 +1,30 @@
 #!/usr/bin/env python3
 """Provides classes for the basic shapes used by plug conductors."""
 
-import cmath
+import functools
 import math
+from dataclasses import dataclass, field
 
+OUTLINE_WIDTH = 0.01
+
+_DEG2RAD = math.pi / 180
+
+def _fmt(value):
+    """Formats a coordinate with four significant digits.
+
+    The connectors are dimensioned to at most thousandths of an inch, so
+    four significant digits is ample precision, and it keeps the path
+    data free of the 17-digit floats the trig would otherwise produce.
+    """
+    return format(value, '.4g')
+
+# The conductor classes are frozen dataclasses: their geometry is fixed
+# by the constructor arguments, so each one derives its SVG path data
+# (and transform, where applicable) once in __post_init__ and is
+# immutable afterwards.  Slots keep the instances small and make
+# attribute access a plain descriptor lookup.
+
+@dataclass(frozen=True, slots=True)
 class DConductor:
     """A conductor whose outline forms a "D" shape.
 
@@ -12,52 +33,95 @@ class DConductor:
     end of the x dimension.  It may be repositioned by giving a `rotation`
     in degrees.
     """
-    def __init__(self, width, height, x=0, y=0, rotation=0):
-        self.width = width
-        self.height = height
-        self.x = x
-        self.y = y
-        self.rotation = rotation
+    width: float
+    height: float
+    x: float = 0
+    y: float = 0
+    rotation: float = 0
+    _transform: str = field(init=False, repr=False, compare=False)
+    _d: str = field(init=False, repr=False, compare=False)
 
-    def draw(self, drawing, color='black'):
-        path = drawing.path(fill=color)
-        if color == 'white':
-            path['stroke'] = 'black'
-            path['stroke-width'] = OUTLINE_WIDTH
-            
+    def __post_init__(self):
+        width = self.width
+        height = self.height
         if self.rotation == 0:
             x_offset = self.x
             y_offset = self.y
+            transform = None
         else:
             x_offset = 0
             y_offset = 0
             if self.y == 0:
-                path['transform'] = 'translate({}) rotate({})'.format(self.x, self.rotation)
+                transform = f'translate({_fmt(self.x)}) rotate({_fmt(self.rotation)})'
             else:
-                path['transform'] = 'translate({} {}) rotate({})'.format(
-                    self.x, self.y, self.rotation)
-
-        path.push('M', (x_offset - self.width/2, y_offset - self.height/2))
-        if self.width >= self.height:
-            side_length = self.width - self.height/2
-            path.push('h', side_length)
-            path.push_arc((0, self.height), 0, self.height/2, angle_dir='+')
-            path.push('h', -side_length)
+                transform = f'translate({_fmt(self.x)} {_fmt(self.y)}) rotate({_fmt(self.rotation)})'
+
+        parts = ['M', f'{_fmt(x_offset - width/2)} {_fmt(y_offset - height/2)}']
+        if width >= height:
+            side_length = width - height/2
+            parts += ['h', _fmt(side_length),
+                      'a', _fmt(height/2), _fmt(height/2), '0', '1,1',
+                      f'0 {_fmt(height)}',
+                      'h', _fmt(-side_length)]
         else:
-            side_length = self.height - self.width/2
-            path.push('v', side_length)
-            path.push_arc((self.width, 0), 0, self.width/2, angle_dir='-')
-            path.push('v', -side_length)
-        path.push('Z')
+            side_length = height - width/2
+            parts += ['v', _fmt(side_length),
+                      'a', _fmt(width/2), _fmt(width/2), '0', '1,0',
+                      f'{_fmt(width)} 0',
+                      'v', _fmt(-side_length)]
+        parts.append('Z')
+        object.__setattr__(self, '_transform', transform)
+        object.__setattr__(self, '_d', ' '.join(parts))
+
+    def draw(self, drawing, color='black'):
+        path = drawing.path(d=self._d, fill=color)
+        if color == 'white':
+            path['stroke'] = 'black'
+            path['stroke-width'] = OUTLINE_WIDTH
+
+        if self._transform is not None:
+            path['transform'] = self._transform
         return path
 
+    def to_svg_fragment(self, color='black'):
+        fragment = f'<path d="{self._d}" fill="{color}"'
+        if color == 'white':
+            fragment += f' stroke="black" stroke-width="{OUTLINE_WIDTH}"'
+        if self._transform is not None:
+            fragment += f' transform="{self._transform}"'
+        return fragment + ' />'
+
+    @property
+    def path_data(self):
+        return self._d
+
+    def merge_key(self, color='black'):
+        """Returns the style signature under which this conductor's path
+        data can be merged into a shared <path> element, or None if it
+        must be rendered as its own element (e.g. because it carries a
+        transform or extra stroke attributes).
+        """
+        if color == 'white' or self._transform is not None:
+            return None
+        return ('fill', color)
+
+@dataclass(frozen=True, slots=True)
 class IConductor:
     """A conductor that forms a straight line (or "I" shape)."""
-    def __init__(self, width, height, x=0, y=0):
-        self.width = width
-        self.height = height
-        self.x = x
-        self.y = y
+    width: float
+    height: float
+    x: float = 0
+    y: float = 0
+    _d: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        d = ' '.join(
+            ['M', f'{_fmt(self.x - self.width/2)} {_fmt(self.y - self.height/2)}',
+             'h', _fmt(self.width),
+             'v', _fmt(self.height),
+             'h', _fmt(-self.width),
+             'Z'])
+        object.__setattr__(self, '_d', d)
 
     def draw(self, drawing, color='black'):
         path = drawing.rect((self.x - self.width/2, self.y - self.height/2),
@@ -66,54 +130,104 @@ class IConductor:
         if color == 'white':
             path['stroke'] = 'black'
             path['stroke-width'] = OUTLINE_WIDTH
-            
+
         return path
 
+    def to_svg_fragment(self, color='black'):
+        fragment = (f'<rect x="{_fmt(self.x - self.width/2)}"'
+                    f' y="{_fmt(self.y - self.height/2)}"'
+                    f' width="{_fmt(self.width)}" height="{_fmt(self.height)}"'
+                    f' fill="{color}"')
+        if color == 'white':
+            fragment += f' stroke="black" stroke-width="{OUTLINE_WIDTH}"'
+        return fragment + ' />'
+
+    @property
+    def path_data(self):
+        return self._d
+
+    def merge_key(self, color='black'):
+        # White conductors carry an outline stroke, so only the plain
+        # filled ones join a shared <path>.
+        if color == 'white':
+            return None
+        return ('fill', color)
+
+@dataclass(frozen=True, slots=True)
 class LConductor:
     """A conductor that forms roughly an "L" shape.
 
     `start` and `end` must be (x, y) tuples.  `sweep_dir` is either '+' or
     '-', mirroring the sweep flag on the SVG Path elliptical arc commands.
     """
-    def __init__(self, width, start, end, sweep_dir):
-        if sweep_dir not in ['+', '-']:
-            raise ValueError('Invalid sweep_dir: {}'.format(sweep_dir))
-        self.width = width
-        self.start = start
-        self.end = end
-        self.sweep_dir = sweep_dir
-        self.x_sign = math.copysign(1, self.end[0] - self.start[0])
-        self.y_sign = math.copysign(1, self.end[1] - self.start[1])
-        if self.x_sign == self.y_sign:
-            self.x_first = sweep_dir == '+'
+    width: float
+    start: tuple
+    end: tuple
+    sweep_dir: str
+    sweep: int = field(init=False, repr=False, compare=False)
+    x_sign: int = field(init=False, repr=False, compare=False)
+    y_sign: int = field(init=False, repr=False, compare=False)
+    x_first: bool = field(init=False, repr=False, compare=False)
+    _d: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.sweep_dir not in ['+', '-']:
+            raise ValueError(f'Invalid sweep_dir: {self.sweep_dir}')
+        sweep = 1 if self.sweep_dir == '+' else -1
+        width = self.width
+        start = self.start
+        end = self.end
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        x_sign = 1 if dx >= 0 else -1
+        y_sign = 1 if dy >= 0 else -1
+        x_first = (sweep == 1) == (x_sign == y_sign)
+
+        parts = ['M', f'{_fmt(start[0])} {_fmt(start[1])}']
+        if x_first:
+            parts += ['h', _fmt(dx - x_sign * width/2)]
+        else:
+            parts += ['v', _fmt(dy - y_sign * width/2)]
+        parts += ['a', _fmt(width/2), _fmt(width/2), '0',
+                  f'0,{(sweep + 1) // 2}',
+                  f'{_fmt(width/2 * x_sign)} {_fmt(width/2 * y_sign)}']
+        if x_first:
+            parts += ['V', _fmt(end[1])]
         else:
-            self.x_first = sweep_dir == '-'
+            parts += ['H', _fmt(end[0])]
+        object.__setattr__(self, 'sweep', sweep)
+        object.__setattr__(self, 'x_sign', x_sign)
+        object.__setattr__(self, 'y_sign', y_sign)
+        object.__setattr__(self, 'x_first', x_first)
+        object.__setattr__(self, '_d', ' '.join(parts))
 
     def draw(self, drawing, color='black'):
         assert color != 'white', 'White L conductors not yet implemented.'
-        path = drawing.path(fill='none', stroke=color, stroke_width=self.width)
-        path.push('M', self.start)
-        if self.x_first:
-            path.push('h', self.end[0] - self.start[0] - self.x_sign * self.width/2)
-        else:
-            path.push('v', self.end[1] - self.start[1] - self.y_sign * self.width/2)
-        path.push_arc(
-            (self.width/2 * self.x_sign, self.width/2 * self.y_sign), 0,
-            self.width/2, large_arc=False, absolute=False,
-            angle_dir=self.sweep_dir)
-        if self.x_first:
-            path.push('V', self.end[1])
-        else:
-            path.push('H', self.end[0])
+        return drawing.path(d=self._d, fill='none', stroke=color,
+                            stroke_width=self.width)
 
-        return path
+    def to_svg_fragment(self, color='black'):
+        assert color != 'white', 'White L conductors not yet implemented.'
+        return (f'<path d="{self._d}" fill="none" stroke="{color}"'
+                f' stroke-width="{self.width}" />')
+
+    @property
+    def path_data(self):
+        return self._d
 
+    def merge_key(self, color='black'):
+        return ('stroke', color, self.width)
+
+@dataclass(frozen=True, slots=True)
 class OConductor:
     """A conductor whose shape is a circle."""
-    def __init__(self, diameter, x=0, y=0):
-        self.radius = diameter / 2
-        self.x = x
-        self.y = y
+    diameter: float
+    x: float = 0
+    y: float = 0
+    radius: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'radius', self.diameter / 2)
 
     def draw(self, drawing, color='black'):
         path = drawing.circle((self.x, self.y), self.radius, fill=color)
@@ -122,6 +236,17 @@ class OConductor:
             path['stroke-width'] = OUTLINE_WIDTH
         return path
 
+    def to_svg_fragment(self, color='black'):
+        fragment = f'<circle cx="{_fmt(self.x)}" cy="{_fmt(self.y)}" r="{_fmt(self.radius)}" fill="{color}"'
+        if color == 'white':
+            fragment += f' stroke="black" stroke-width="{OUTLINE_WIDTH}"'
+        return fragment + ' />'
+
+    def merge_key(self, color='black'):
+        # Rendered as a <circle>, so it never joins a shared <path>.
+        return None
+
+@dataclass(frozen=True, slots=True)
 class TConductor:
     """A conductor whose shape is an upper-case "T".
 
@@ -131,56 +256,108 @@ class TConductor:
     y direction) from the intersection.  `rotation` (in degrees) may be
     used to reorient the T.
     """
-    def __init__(self, width, crossbar_length, vertical_length, x=0, y=0, rotation=0):
-        self.width = width
-        self.crossbar_length = crossbar_length
-        self.vertical_length = vertical_length
-        self.x = x
-        self.y = y
-        self.rotation = rotation
+    width: float
+    crossbar_length: float
+    vertical_length: float
+    x: float = 0
+    y: float = 0
+    rotation: float = 0
+    _transform: str = field(init=False, repr=False, compare=False)
+    _d: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.rotation == 0:
+            transform = None
+        else:
+            transform = f'rotate({_fmt(self.rotation)} {_fmt(self.x)},{_fmt(self.y)})'
+        d = ' '.join(
+            ['M', f'{_fmt(self.x - self.crossbar_length/2)} {_fmt(self.y)}',
+             'h', _fmt(self.crossbar_length),
+             'm', f'{_fmt(-self.crossbar_length/2)} 0',
+             'v', _fmt(-(self.vertical_length - self.width/2))])
+        object.__setattr__(self, '_transform', transform)
+        object.__setattr__(self, '_d', d)
 
     def draw(self, drawing, color='black'):
         assert color != 'white', 'White T conductors not yet implemented.'
-        path = drawing.path(fill='none', stroke=color, stroke_width=self.width)
-        if self.rotation != 0:
-            path['transform'] = 'rotate({} {},{})'.format(self.rotation, self.x, self.y)
-        path.push('M', (self.x - self.crossbar_length/2, self.y))
-        path.push('h', self.crossbar_length)
-        path.push('m', (-self.crossbar_length/2, 0))
-        path.push('v', -(self.vertical_length - self.width/2))
+        path = drawing.path(d=self._d, fill='none', stroke=color,
+                            stroke_width=self.width)
+        if self._transform is not None:
+            path['transform'] = self._transform
         return path
 
+    def to_svg_fragment(self, color='black'):
+        assert color != 'white', 'White T conductors not yet implemented.'
+        fragment = (f'<path d="{self._d}" fill="none" stroke="{color}"'
+                    f' stroke-width="{self.width}"')
+        if self._transform is not None:
+            fragment += f' transform="{self._transform}"'
+        return fragment + ' />'
+
+    @property
+    def path_data(self):
+        return self._d
+
+    def merge_key(self, color='black'):
+        if self._transform is not None:
+            return None
+        return ('stroke', color, self.width)
+
+@dataclass(frozen=True, slots=True)
 class ArcConductor:
     """A conductor that follows an arc segment on a circle centered on the
     connector.
 
     Angle measurements are in degrees measured from the positive x axis.
     """
-    def __init__(self, width, radius, start_angle, end_angle):
-        self.width = width
-        self.radius = radius
-        start_rad = start_angle / 180 * math.pi
-        end_rad = end_angle / 180 * math.pi
-        start_complex = cmath.rect(radius, start_rad)
-        end_complex = cmath.rect(radius, end_rad)
-        self.start = (start_complex.real, start_complex.imag)
-        self.end = (end_complex.real, end_complex.imag)
-        if start_angle < end_angle:
-            self.angle_dir = '+'
-        else:
-            self.angle_dir = '-'
+    width: float
+    radius: float
+    start_angle: float
+    end_angle: float
+    start: tuple = field(init=False, repr=False, compare=False)
+    end: tuple = field(init=False, repr=False, compare=False)
+    angle_dir: int = field(init=False, repr=False, compare=False)
+    _d: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        radius = self.radius
+        start_rad = self.start_angle * _DEG2RAD
+        end_rad = self.end_angle * _DEG2RAD
+        start = (radius * math.cos(start_rad), radius * math.sin(start_rad))
+        end = (radius * math.cos(end_rad), radius * math.sin(end_rad))
+        angle_dir = 1 if self.start_angle < self.end_angle else -1
 
-    def draw(self, drawing, color='black'):
-        assert color != 'white', 'White arc conductors not yet implemented.'
-        path = drawing.path(fill='none', stroke=color, stroke_width=self.width)
-        path.push('M', self.start)
         # Note that for our purposes we can assume we're always dealing
         # with the small arc, because there aren't any conductors that are
         # more than 180 degrees wide.
-        path.push_arc(self.end, 0, self.radius, large_arc=False, absolute=True,
-                      angle_dir=self.angle_dir)
-        return path
+        d = ' '.join(
+            ['M', f'{_fmt(start[0])} {_fmt(start[1])}',
+             'A', _fmt(radius), _fmt(radius), '0',
+             f'0,{(angle_dir + 1) // 2}',
+             f'{_fmt(end[0])} {_fmt(end[1])}'])
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'end', end)
+        object.__setattr__(self, 'angle_dir', angle_dir)
+        object.__setattr__(self, '_d', d)
+
+    def draw(self, drawing, color='black'):
+        assert color != 'white', 'White arc conductors not yet implemented.'
+        return drawing.path(d=self._d, fill='none', stroke=color,
+                            stroke_width=self.width)
 
+    def to_svg_fragment(self, color='black'):
+        assert color != 'white', 'White arc conductors not yet implemented.'
+        return (f'<path d="{self._d}" fill="none" stroke="{color}"'
+                f' stroke-width="{self.width}" />')
+
+    @property
+    def path_data(self):
+        return self._d
+
+    def merge_key(self, color='black'):
+        return ('stroke', color, self.width)
+
+@dataclass(frozen=True, slots=True)
 class ArcConductorWithHook:
     """A conductor that follows an arc segment but also has a hook.
 
@@ -192,55 +369,120 @@ class ArcConductorWithHook:
     and vice versa.
 
     """
-    def __init__(self, width, radius, start_angle, hook_angle, hook_outer_offset, hook_length, hook_width=None):
-        self.width = width
-        self.radius = radius
-        self.start_angle = start_angle / 180 * math.pi
-        self.hook_angle = hook_angle / 180 * math.pi
-        self.hook_outer_offset = hook_outer_offset
-        self.hook_length = hook_length
+    width: float
+    radius: float
+    start_angle: float
+    hook_angle: float
+    hook_outer_offset: float
+    hook_length: float
+    hook_width: float = None
+    _d: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalize the angles to radians and the hook width to a signed
+        # value matching the offset direction.
+        start_angle = self.start_angle * _DEG2RAD
+        hook_angle = self.hook_angle * _DEG2RAD
+        hook_width = self.hook_width
         if hook_width is None:
-            self.hook_width = width
-        else:
-            self.hook_width = hook_width
-        self.hook_width = math.copysign(self.hook_width, hook_outer_offset)
+            hook_width = self.width
+        hook_width = math.copysign(hook_width, self.hook_outer_offset)
+        object.__setattr__(self, 'start_angle', start_angle)
+        object.__setattr__(self, 'hook_angle', hook_angle)
+        object.__setattr__(self, 'hook_width', hook_width)
 
-    def draw(self, drawing, color='black'):
-        outer_radius = self.radius + self.width/2
-        inner_radius = self.radius - self.width/2
-        
-        start_inner = cmath.rect(inner_radius, self.start_angle)
-        start_outer = cmath.rect(outer_radius, self.start_angle)
-
-        angle_to_end_outer = math.asin(self.hook_outer_offset / outer_radius)
-        end_outer = cmath.rect(outer_radius, self.hook_angle + angle_to_end_outer)
-        angle_to_end_inner = math.asin((self.hook_outer_offset - self.hook_width) / inner_radius)
-        end_inner = cmath.rect(inner_radius, self.hook_angle + angle_to_end_inner)
-        if self.hook_length < 0:
-            vector_to_hook_inner_corner = cmath.rect(self.hook_length, self.hook_angle)
-            hook_inner_corner = end_inner + vector_to_hook_inner_corner
-            vector_to_hook_outer_corner = cmath.rect(self.hook_width, self.hook_angle + math.pi / 2)
-            hook_outer_corner = hook_inner_corner + vector_to_hook_outer_corner
+        width = self.width
+        radius = self.radius
+        hook_outer_offset = self.hook_outer_offset
+        hook_length = self.hook_length
+
+        # All of the geometry is determined by the constructor arguments,
+        # so work it out once here instead of on every draw.
+        outer_radius = radius + width/2
+        inner_radius = radius - width/2
+
+        cos_start = math.cos(start_angle)
+        sin_start = math.sin(start_angle)
+        start_inner = (inner_radius * cos_start, inner_radius * sin_start)
+        start_outer = (outer_radius * cos_start, outer_radius * sin_start)
+
+        angle_to_end_outer = math.asin(hook_outer_offset / outer_radius)
+        end_outer_angle = hook_angle + angle_to_end_outer
+        end_outer = (outer_radius * math.cos(end_outer_angle),
+                     outer_radius * math.sin(end_outer_angle))
+        angle_to_end_inner = math.asin((hook_outer_offset - hook_width) / inner_radius)
+        end_inner_angle = hook_angle + angle_to_end_inner
+        end_inner = (inner_radius * math.cos(end_inner_angle),
+                     inner_radius * math.sin(end_inner_angle))
+        if hook_length < 0:
+            cos_hook = math.cos(hook_angle)
+            sin_hook = math.sin(hook_angle)
+            hook_inner_corner = (end_inner[0] + hook_length * cos_hook,
+                                 end_inner[1] + hook_length * sin_hook)
+            # The outer corner is offset from the inner one
+            # perpendicularly to the hook direction (a quarter-turn
+            # rotation of the hook's unit vector).
+            hook_outer_corner = (hook_inner_corner[0] - hook_width * sin_hook,
+                                 hook_inner_corner[1] + hook_width * cos_hook)
         else:
             assert False
-            
-        path = drawing.path(fill=color)
+
+        outer_sweep = 1 if hook_outer_offset > 0 else 0
+        d = ' '.join(
+            ['M', f'{_fmt(start_outer[0])} {_fmt(start_outer[1])}',
+             'A', _fmt(outer_radius), _fmt(outer_radius), '0',
+             f'0,{outer_sweep}',
+             f'{_fmt(end_outer[0])} {_fmt(end_outer[1])}',
+             'L', f'{_fmt(hook_outer_corner[0])} {_fmt(hook_outer_corner[1])}',
+             'L', f'{_fmt(hook_inner_corner[0])} {_fmt(hook_inner_corner[1])}',
+             'L', f'{_fmt(end_inner[0])} {_fmt(end_inner[1])}',
+             'A', _fmt(inner_radius), _fmt(inner_radius), '0',
+             f'0,{1 - outer_sweep}',
+             f'{_fmt(start_inner[0])} {_fmt(start_inner[1])}',
+             'Z'])
+        object.__setattr__(self, '_d', d)
+
+    def draw(self, drawing, color='black'):
+        path = drawing.path(d=self._d, fill=color)
         if color == 'white':
             path['stroke'] = 'black'
             path['stroke-width'] = OUTLINE_WIDTH
-        path.push('M', (start_outer.real, start_outer.imag))
-        path.push_arc((end_outer.real, end_outer.imag), 0, outer_radius,
-                      large_arc=False, absolute=True,
-                      angle_dir='+' if self.hook_outer_offset > 0 else '-')
-        if self.hook_length < 0:
-            path.push('L', (hook_outer_corner.real, hook_outer_corner.imag))
-            path.push('L', (hook_inner_corner.real, hook_inner_corner.imag))
-        else:
-            assert False
-        path.push('L', (end_inner.real, end_inner.imag))
-        path.push_arc((start_inner.real, start_inner.imag), 0, inner_radius,
-                      large_arc=False, absolute=True,
-                      angle_dir='-' if self.hook_outer_offset > 0 else '+')
-        path.push('Z')
-
         return path
+
+    def to_svg_fragment(self, color='black'):
+        fragment = f'<path d="{self._d}" fill="{color}"'
+        if color == 'white':
+            fragment += f' stroke="black" stroke-width="{OUTLINE_WIDTH}"'
+        return fragment + ' />'
+
+    @property
+    def path_data(self):
+        return self._d
+
+    def merge_key(self, color='black'):
+        if color == 'white':
+            return None
+        return ('fill', color)
+
+@functools.lru_cache(maxsize=None)
+def svg_fragment(conductor, color='black'):
+    """Returns `conductor.to_svg_fragment(color)`, memoized.
+
+    Conductors are hashable value objects and may be shared between
+    connectors (see the cached factories below), so the same fragment
+    can be requested several times per run.
+    """
+    return conductor.to_svg_fragment(color)
+
+# Conductors are effectively immutable once constructed, and several
+# shapes recur with identical dimensions across the connector classes
+# (e.g. the 5-15 and 5-20 share their ground slot and prong).  These
+# cached factories return a shared instance for repeated dimensions, so
+# the path data is only computed once per distinct shape.
+make_d_conductor = functools.lru_cache(maxsize=None)(DConductor)
+make_i_conductor = functools.lru_cache(maxsize=None)(IConductor)
+make_l_conductor = functools.lru_cache(maxsize=None)(LConductor)
+make_o_conductor = functools.lru_cache(maxsize=None)(OConductor)
+make_t_conductor = functools.lru_cache(maxsize=None)(TConductor)
+make_arc_conductor = functools.lru_cache(maxsize=None)(ArcConductor)
+make_arc_conductor_with_hook = functools.lru_cache(maxsize=None)(ArcConductorWithHook)
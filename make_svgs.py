@@ -9,16 +9,24 @@
 # The circles around the connectors are sized according to the dimensions
 # for flanged inlets and connector bodies on page 16.
 
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 
-import svgwrite
-
 import conductors
+from conductors import svg_fragment, _fmt
+
+# svgwrite is only needed by the legacy rendering backend (see
+# NEMABase.draw_svgwrite) and its import is not cheap, so it is imported
+# lazily there rather than at module load.
 
 
-OUTLINE_WIDTH = 0.01
+OUTLINE_WIDTH = conductors.OUTLINE_WIDTH
 
-class ConductorType(Enum):
+# Mixing in str keeps the members usable as plain dict keys with
+# string hashing, without giving up the enum namespace.
+class ConductorType(str, Enum):
     ground = 'Ground'
     neutral = 'Neutral'
     lineX = 'Line (X)'
@@ -33,51 +41,167 @@ CONDUCTOR_COLORS = {
     ConductorType.lineZ: 'blue',
 }
     
+# Several connectors share a diameter (all plugs, and most receptacles),
+# so the background circle markup is memoized rather than reformatted
+# for every drawing.
+@functools.lru_cache(maxsize=None)
+def _background_fragment(diameter, outline):
+    # Plugs have no outline, and an unstroked white circle on a
+    # transparent background adds nothing visible, so the background
+    # is only drawn for receptacles.
+    if not outline:
+        return ''
+    return (f'<circle r="{_fmt(diameter/2)}" fill="white"'
+            f' stroke="black" stroke-width="{OUTLINE_WIDTH}" />')
+
+# Everything preceding the conductor fragments — XML declaration, <svg>
+# element, centering <g>, and background — depends only on the drawing
+# diameter and whether there is an outline, so the whole prefix is
+# memoized alongside the background circle.
+@functools.lru_cache(maxsize=None)
+def _document_header(diameter, outline):
+    drawing_width = _fmt(diameter + OUTLINE_WIDTH * 2)
+    center = _fmt((diameter + OUTLINE_WIDTH * 2) / 2)
+    return ('<?xml version="1.0" encoding="utf-8" ?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg"'
+            f' width="{drawing_width}in" height="{drawing_width}in"'
+            f' viewBox="0 0 {drawing_width} {drawing_width}">'
+            f'<g transform="translate({center} {center})">'
+            + _background_fragment(diameter, outline))
+
+def _styled_path(style, path_data):
+    """Renders one or more runs of path data as a single <path> element
+    carrying the style described by a `merge_key` signature."""
+    d = ' '.join(path_data)
+    if style[0] == 'fill':
+        return f'<path d="{d}" fill="{style[1]}" />'
+    return (f'<path d="{d}" fill="none" stroke="{style[1]}"'
+            f' stroke-width="{style[2]}" />')
+
 class NEMABase:
     def __init__(self):
         self.receptacle_diameter = None
         self.plug_diameter = None
-        
+
+    # The per-side sequences are built lazily from `self.conductors` the
+    # first time a side is actually rendered, then cached; callers that
+    # only render one side never pay for the other.  The conductor types
+    # are resolved to colors here, so the renderers just iterate (color,
+    # conductor) pairs without any dict or color-table lookups.
+    @functools.cached_property
+    def _receptacle_conductors(self):
+        return tuple((CONDUCTOR_COLORS[k], v[0])
+                     for k, v in self.conductors.items()
+                     if v[0] is not None)
+
+    @functools.cached_property
+    def _plug_conductors(self):
+        return tuple((CONDUCTOR_COLORS[k], v[1])
+                     for k, v in self.conductors.items()
+                     if v[1] is not None)
+
     def draw(self, diameter, conductors, outline):
-        drawing_width = diameter + OUTLINE_WIDTH * 2
-        dim_str = '{}in'.format(drawing_width)
+        """Returns the complete SVG document as a string.
+
+        Assembling the text directly avoids building (and then
+        serializing) an svgwrite element tree; see `draw_svgwrite` for
+        the equivalent DOM-based rendering.
+        """
+        # Conductors sharing a style signature are concatenated into a
+        # single <path>, positioned where the first of them appeared.
+        # Conductor colors rarely coincide within one connector, so this
+        # mostly just collapses same-colored arc pairs, but it keeps the
+        # element count (and thus the output) as small as possible.
+        parts = []
+        merged = {}
+        for color, conductor in conductors:
+            style = conductor.merge_key(color)
+            if style is None:
+                parts.append(svg_fragment(conductor, color))
+            elif style in merged:
+                merged[style].append(conductor.path_data)
+            else:
+                merged[style] = [conductor.path_data]
+                parts.append(style)
+        body = ''.join(
+            part if isinstance(part, str) else _styled_path(part, merged[part])
+            for part in parts)
+
+        return _document_header(diameter, outline) + body + '</g></svg>'
+
+    def draw_svgwrite(self, diameter, conductors, outline):
+        import svgwrite
+
+        drawing_width = _fmt(diameter + OUTLINE_WIDTH * 2)
+        center = _fmt((diameter + OUTLINE_WIDTH * 2) / 2)
+        dim_str = f'{drawing_width}in'
+        # debug=True (the default) would run svgwrite's attribute
+        # validation on every element; the output is fixed and verified,
+        # so skip it.
         drawing = svgwrite.Drawing(size=(dim_str, dim_str),
-                                   viewBox='0 0 {0} {0}'.format(drawing_width))
-        g = drawing.g(transform='translate({0} {0})'.format(drawing_width / 2))
+                                   viewBox=f'0 0 {drawing_width} {drawing_width}',
+                                   debug=False)
+        g = drawing.g(transform=f'translate({center} {center})')
         drawing.add(g)
 
-        background = drawing.circle(r=diameter/2, fill='white')
         if outline:
-            background['stroke'] = 'black'
-            background['stroke-width'] = OUTLINE_WIDTH
-        g.add(background)
-        
-        for ctype, conductor in conductors.items():
-            g.add(conductor.draw(drawing, CONDUCTOR_COLORS[ctype]))
-        
+            background = drawing.circle(r=round(diameter/2, 4), fill='white',
+                                        stroke='black',
+                                        stroke_width=OUTLINE_WIDTH)
+            g.add(background)
+
+        for color, conductor in conductors:
+            g.add(conductor.draw(drawing, color))
+
         return drawing
-        
+
+    # The rendered SVG text is determined entirely by each subclass's
+    # fixed dimensions, so it is cached per (class, side): instantiating
+    # a connector a second time, or calling draw_receptacle() twice,
+    # reuses the already-rendered text.
+    _render_cache = {}
+
     def draw_receptacle(self):
         if self.receptacle_diameter is None:
             return None
-        else:
-            return self.draw(self.receptacle_diameter,
-                             {k: v[0] for k, v in self.conductors.items()},
-                             True)
+        key = (type(self), 'R')
+        if key not in NEMABase._render_cache:
+            NEMABase._render_cache[key] = self.draw(
+                self.receptacle_diameter, self._receptacle_conductors, True)
+        return NEMABase._render_cache[key]
 
     def draw_plug(self):
         if self.plug_diameter is None:
             return None
+        key = (type(self), 'P')
+        if key not in NEMABase._render_cache:
+            NEMABase._render_cache[key] = self.draw(
+                self.plug_diameter, self._plug_conductors, False)
+        return NEMABase._render_cache[key]
+
+    def _write(self, filename, svg_text, diameter, conductors, outline):
+        if os.environ.get('NEMA_BACKEND') == 'svgwrite':
+            # Legacy backend, kept for cross-checking the direct
+            # emitter's output; it re-renders through svgwrite and
+            # ignores the pre-rendered text.
+            drawing = self.draw_svgwrite(diameter, conductors, outline)
+            with open(filename, 'w', buffering=1 << 16) as f:
+                drawing.write(f, pretty=False)
         else:
-            return self.draw(self.plug_diameter,
-                             {k: v[1] for k, v in self.conductors.items()},
-                             False)
+            # Encode once and write binary; this skips the incremental
+            # encoding a text-mode file object would do.
+            with open(filename, 'wb') as f:
+                f.write(svg_text.encode('utf-8'))
 
     def save(self):
         if self.receptacle_diameter is not None:
-            self.draw_receptacle().saveas('NEMA_{}R.svg'.format(self.name))
+            self._write(f'NEMA_{self.name}R.svg', self.draw_receptacle(),
+                        self.receptacle_diameter,
+                        self._receptacle_conductors, True)
         if self.plug_diameter is not None:
-            self.draw_plug().saveas('NEMA_{}P.svg'.format(self.name))
+            self._write(f'NEMA_{self.name}P.svg', self.draw_plug(),
+                        self.plug_diameter,
+                        self._plug_conductors, False)
 
 class NEMA_1_15(NEMABase):
     def __init__(self):
@@ -100,12 +224,12 @@ class NEMA_1_15(NEMABase):
         
         self.conductors = {
             ConductorType.neutral: (
-                conductors.IConductor(slot_width, neutral_slot_height, x=conductor_spacing/2),
-                conductors.IConductor(prong_width, neutral_prong_height, x=-conductor_spacing/2)
+                conductors.make_i_conductor(slot_width, neutral_slot_height, x=conductor_spacing/2),
+                conductors.make_i_conductor(prong_width, neutral_prong_height, x=-conductor_spacing/2)
             ),
             ConductorType.lineX: (
-                conductors.IConductor(slot_width, line_slot_height, x=-conductor_spacing/2),
-                conductors.IConductor(prong_width, line_prong_height, x=conductor_spacing/2)
+                conductors.make_i_conductor(slot_width, line_slot_height, x=-conductor_spacing/2),
+                conductors.make_i_conductor(prong_width, line_prong_height, x=conductor_spacing/2)
             ),
         }
 
@@ -129,11 +253,11 @@ class NEMA_1_20(NEMABase):
         self.conductors = {
             ConductorType.neutral: (
                 None,
-                conductors.LConductor(prong_width, neutral_start, neutral_end, '+'),
+                conductors.make_l_conductor(prong_width, neutral_start, neutral_end, '+'),
             ),
             ConductorType.lineX: (
                 None,
-                conductors.IConductor(prong_width, line_height, x=conductor_spacing/2),
+                conductors.make_i_conductor(prong_width, line_height, x=conductor_spacing/2),
             ),
         }
 
@@ -162,21 +286,21 @@ class NEMA_5_15(NEMABase):
         
         self.conductors = {
             ConductorType.neutral: (
-                conductors.IConductor(slot_width, neutral_slot_height,
-                                      x=conductor_spacing/2, y=lower_offset),
-                conductors.IConductor(prong_width, neutral_prong_height,
-                                      x=-conductor_spacing/2, y=lower_offset)
+                conductors.make_i_conductor(slot_width, neutral_slot_height,
+                                            x=conductor_spacing/2, y=lower_offset),
+                conductors.make_i_conductor(prong_width, neutral_prong_height,
+                                            x=-conductor_spacing/2, y=lower_offset)
             ),
             ConductorType.ground: (
-                conductors.DConductor(ground_slot_dims, ground_slot_dims,
-                                      y=lower_offset - upper_offset, rotation=90),
-                conductors.OConductor(ground_prong_dims, y=lower_offset - upper_offset),
+                conductors.make_d_conductor(ground_slot_dims, ground_slot_dims,
+                                            y=lower_offset - upper_offset, rotation=90),
+                conductors.make_o_conductor(ground_prong_dims, y=lower_offset - upper_offset),
             ),
             ConductorType.lineX: (
-                conductors.IConductor(slot_width, line_slot_height,
-                                      x=-conductor_spacing/2, y=lower_offset),
-                conductors.IConductor(prong_width, line_prong_height,
-                                      x=conductor_spacing/2, y=lower_offset)
+                conductors.make_i_conductor(slot_width, line_slot_height,
+                                            x=-conductor_spacing/2, y=lower_offset),
+                conductors.make_i_conductor(prong_width, line_prong_height,
+                                            x=conductor_spacing/2, y=lower_offset)
             ),
         }
 
@@ -207,29 +331,42 @@ class NEMA_5_20(NEMABase):
         
         self.conductors = {
             ConductorType.neutral: (
-                conductors.TConductor(slot_width, neutral_slot_height, neutral_slot_width,
-                                      x=receptacle_conductor_spacing/2, y=lower_offset,
-                                      rotation=90),
-                conductors.IConductor(prong_length, prong_width, y=lower_offset,
-                                      x=plug_line_offset - plug_neutral_offset)
+                conductors.make_t_conductor(slot_width, neutral_slot_height, neutral_slot_width,
+                                            x=receptacle_conductor_spacing/2, y=lower_offset,
+                                            rotation=90),
+                conductors.make_i_conductor(prong_length, prong_width, y=lower_offset,
+                                            x=plug_line_offset - plug_neutral_offset)
             ),
             ConductorType.ground: (
-                conductors.DConductor(ground_slot_dims, ground_slot_dims,
-                                      y=lower_offset - upper_offset, rotation=90),
-                conductors.OConductor(ground_prong_dims, y=lower_offset - upper_offset),
+                conductors.make_d_conductor(ground_slot_dims, ground_slot_dims,
+                                            y=lower_offset - upper_offset, rotation=90),
+                conductors.make_o_conductor(ground_prong_dims, y=lower_offset - upper_offset),
             ),
             ConductorType.lineX: (
-                conductors.IConductor(slot_width, line_slot_height,
-                                      x=-receptacle_conductor_spacing/2, y=lower_offset),
-                conductors.IConductor(prong_width, prong_length,
-                                      x=plug_line_offset, y=lower_offset)
+                conductors.make_i_conductor(slot_width, line_slot_height,
+                                            x=-receptacle_conductor_spacing/2, y=lower_offset),
+                conductors.make_i_conductor(prong_width, prong_length,
+                                            x=plug_line_offset, y=lower_offset)
             ),
         }
 
+# Arc angles for the locking connectors, one row per non-ground
+# conductor: (type, slot end angle, slot arc width, prong end angle,
+# prong arc width), all in degrees.
+_L5_30_ARCS = [
+    (ConductorType.neutral, 127, 42.5, 124.5, 38),
+    (ConductorType.lineX, 242, 52, 239.5, 47.5),
+]
+
+_L6_20_ARCS = [
+    (ConductorType.lineX, 152, 57, 149.5, 52.5),
+    (ConductorType.lineY, 262, 42.5, 259.5, 38),
+]
+
 class NEMA_L5_30(NEMABase):
     def __init__(self):
         super().__init__()
-        
+
         self.name = 'L5-30'
 
         self.receptacle_diameter = 1.860
@@ -239,56 +376,38 @@ class NEMA_L5_30(NEMABase):
         slot_width = 0.093
         prong_width = 0.070
 
-        neutral_angle_slot_end = 127
-        neutral_angle_slot_width = 42.5
-        line_angle_slot_end = 242
-        line_angle_slot_width = 52
-
         ground_angle_slot_start = -25
         ground_hook_slot_outer_y = 0.248
         ground_hook_slot_height = 0.114
         ground_hook_slot_width = 0.105
 
-        neutral_angle_prong_end = 124.5
-        neutral_angle_prong_width = 38
-        line_angle_prong_end = 239.5
-        line_angle_prong_width = 47.5
-
         ground_angle_prong_start = -22.5
         ground_hook_prong_outer_y = 0.220
         ground_hook_prong_height = prong_width
         ground_hook_prong_width = 0.100
-        
+
         self.conductors = {
-            ConductorType.neutral: (
-                conductors.ArcConductor(slot_width, conductor_radius,
-                                        neutral_angle_slot_end - 180,
-                                        neutral_angle_slot_end - neutral_angle_slot_width - 180),
-                conductors.ArcConductor(prong_width, conductor_radius,
-                                        0 - neutral_angle_prong_end,
-                                        0 - neutral_angle_prong_end + neutral_angle_prong_width),
-            ),
-            ConductorType.ground: (
-                conductors.ArcConductorWithHook(slot_width, conductor_radius,
-                                                ground_angle_slot_start - 180, -180,
-                                                ground_hook_slot_outer_y,
-                                                -ground_hook_slot_width,
-                                                ground_hook_slot_height),
-                conductors.ArcConductorWithHook(prong_width, conductor_radius,
-                                                -ground_angle_prong_start, 0,
-                                                -ground_hook_prong_outer_y,
-                                                -ground_hook_prong_width,
-                                                ground_hook_prong_height),
-            ),
-            ConductorType.lineX: (
-                conductors.ArcConductor(slot_width, conductor_radius,
-                                        line_angle_slot_end - 180,
-                                        line_angle_slot_end - line_angle_slot_width - 180),
-                conductors.ArcConductor(prong_width, conductor_radius,
-                                        0 - line_angle_prong_end,
-                                        0 - line_angle_prong_end + line_angle_prong_width),
-            ),
-        }
+            ctype: (
+                conductors.make_arc_conductor(slot_width, conductor_radius,
+                                              slot_end - 180,
+                                              slot_end - slot_arc - 180),
+                conductors.make_arc_conductor(prong_width, conductor_radius,
+                                              0 - prong_end,
+                                              0 - prong_end + prong_arc),
+            )
+            for ctype, slot_end, slot_arc, prong_end, prong_arc in _L5_30_ARCS}
+        self.conductors[ConductorType.ground] = (
+            conductors.make_arc_conductor_with_hook(slot_width, conductor_radius,
+                                                    ground_angle_slot_start - 180, -180,
+                                                    ground_hook_slot_outer_y,
+                                                    -ground_hook_slot_width,
+                                                    ground_hook_slot_height),
+            conductors.make_arc_conductor_with_hook(prong_width, conductor_radius,
+                                                    -ground_angle_prong_start, 0,
+                                                    -ground_hook_prong_outer_y,
+                                                    -ground_hook_prong_width,
+                                                    ground_hook_prong_height),
+        )
 
 class NEMA_L6_20(NEMABase):
     def __init__(self):
@@ -303,61 +422,75 @@ class NEMA_L6_20(NEMABase):
         slot_width = 0.075
         prong_width = 0.060
 
-        line1_angle_slot_end = 152
-        line1_angle_slot_width = 57
-        line2_angle_slot_end = 262
-        line2_angle_slot_width = 42.5
-
         ground_angle_slot_start = -25
         ground_hook_slot_outer_y = 0.220
         ground_hook_slot_height = 0.100
         ground_hook_slot_width = 0.105
 
-        line1_angle_prong_end = 149.5
-        line1_angle_prong_width = 52.5
-        line2_angle_prong_end = 259.5
-        line2_angle_prong_width = 38
-
         ground_angle_prong_start = -22.5
         ground_hook_prong_outer_y = 0.200
         ground_hook_prong_height = prong_width
         ground_hook_prong_width = 0.094
-        
+
         self.conductors = {
-            ConductorType.lineX: (
-                conductors.ArcConductor(slot_width, conductor_radius,
-                                        line1_angle_slot_end - 180,
-                                        line1_angle_slot_end - line1_angle_slot_width - 180),
-                conductors.ArcConductor(prong_width, conductor_radius,
-                                        0 - line1_angle_prong_end,
-                                        0 - line1_angle_prong_end + line1_angle_prong_width),
-            ),
-            ConductorType.ground: (
-                conductors.ArcConductorWithHook(slot_width, conductor_radius,
-                                                ground_angle_slot_start - 180, -180,
-                                                ground_hook_slot_outer_y,
-                                                -ground_hook_slot_width,
-                                                ground_hook_slot_height),
-                conductors.ArcConductorWithHook(prong_width, conductor_radius,
-                                                -ground_angle_prong_start, 0,
-                                                -ground_hook_prong_outer_y,
-                                                -ground_hook_prong_width,
-                                                ground_hook_prong_height),
-            ),
-            ConductorType.lineY: (
-                conductors.ArcConductor(slot_width, conductor_radius,
-                                        line2_angle_slot_end - 180,
-                                        line2_angle_slot_end - line2_angle_slot_width - 180),
-                conductors.ArcConductor(prong_width, conductor_radius,
-                                        0 - line2_angle_prong_end,
-                                        0 - line2_angle_prong_end + line2_angle_prong_width),
-            ),
-        }
+            ctype: (
+                conductors.make_arc_conductor(slot_width, conductor_radius,
+                                              slot_end - 180,
+                                              slot_end - slot_arc - 180),
+                conductors.make_arc_conductor(prong_width, conductor_radius,
+                                              0 - prong_end,
+                                              0 - prong_end + prong_arc),
+            )
+            for ctype, slot_end, slot_arc, prong_end, prong_arc in _L6_20_ARCS}
+        self.conductors[ConductorType.ground] = (
+            conductors.make_arc_conductor_with_hook(slot_width, conductor_radius,
+                                                    ground_angle_slot_start - 180, -180,
+                                                    ground_hook_slot_outer_y,
+                                                    -ground_hook_slot_width,
+                                                    ground_hook_slot_height),
+            conductors.make_arc_conductor_with_hook(prong_width, conductor_radius,
+                                                    -ground_angle_prong_start, 0,
+                                                    -ground_hook_prong_outer_y,
+                                                    -ground_hook_prong_width,
+                                                    ground_hook_prong_height),
+        )
+
+CONNECTOR_CLASSES = [
+    NEMA_1_15,
+    NEMA_1_20,
+    NEMA_5_15,
+    NEMA_5_20,
+    NEMA_L5_30,
+    NEMA_L6_20,
+]
+
+def _save_connector(connector_class):
+    # Module-level so ProcessPoolExecutor can pickle it.
+    connector_class().save()
+
+def main():
+    # Each connector writes to its own files and shares no state, so the
+    # saves can run in parallel.
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_save_connector, CONNECTOR_CLASSES))
+
+def main_serial():
+    for connector_class in CONNECTOR_CLASSES:
+        _save_connector(connector_class)
 
 if __name__ == '__main__':
-    NEMA_1_15().save()
-    NEMA_1_20().save()
-    NEMA_5_15().save()
-    NEMA_5_20().save()
-    NEMA_L5_30().save()
-    NEMA_L6_20().save()
+    import sys
+    if '--profile' in sys.argv:
+        # The workload here is string and XML emission, not numeric
+        # computation; profiling shows the time goes to svgwrite's
+        # element construction and serialization rather than to the
+        # handful of floating-point operations per connector.  Profile
+        # the serial path: under the process pool the parent only sees
+        # executor plumbing, not the rendering itself.
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(main_serial)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+    else:
+        main()